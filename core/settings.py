@@ -8,6 +8,8 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 load_dotenv(os.path.join(BASE_DIR, '.env'))
 
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
 SECRET_KEY = os.getenv('SECRET_KEY', 'django-insecure-change-me')
 
 DEBUG = os.getenv('DEBUG', 'False').lower() in ('true', '1', 'yes')
@@ -78,6 +80,8 @@ MONGO_ROOT_PASSWORD = os.getenv('MONGO_ROOT_PASSWORD', 'admin123')
 MONGO_DATABASE = os.getenv('MONGO_DATABASE', 'search_client_db')
 MONGO_HOST = os.getenv('MONGO_HOST', 'mongodb')
 MONGO_PORT = int(os.getenv('MONGO_PORT', 27017))
+MONGO_MAX_POOL_SIZE = int(os.getenv('MONGO_MAX_POOL_SIZE', 200))
+MONGO_MIN_POOL_SIZE = int(os.getenv('MONGO_MIN_POOL_SIZE', 20))
 
 MONGODB_USERNAME_ENCODED = quote_plus(MONGO_ROOT_USERNAME)
 MONGODB_PASSWORD_ENCODED = quote_plus(MONGO_ROOT_PASSWORD)
@@ -88,14 +92,22 @@ mongoengine.connect(
     db=MONGO_DATABASE,
     host=MONGODB_URI,
     alias='default',
-    maxPoolSize=50,
-    minPoolSize=10,
-    serverSelectionTimeoutMS=5000,
+    maxPoolSize=MONGO_MAX_POOL_SIZE,
+    minPoolSize=MONGO_MIN_POOL_SIZE,
+    waitQueueTimeoutMS=2000,
+    serverSelectionTimeoutMS=3000,
     connectTimeoutMS=10000,
-    socketTimeoutMS=10000,
+    socketTimeoutMS=5000,
 )
 
 
+PASSWORD_HASHERS = [
+    'user.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -180,7 +192,7 @@ CORS_ALLOW_HEADERS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.OrjsonRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -287,6 +299,7 @@ LOGGING = {
 
 GO_SERVICE_GRPC_HOST = os.getenv('GO_SERVICE_GRPC_HOST', 'localhost')
 GO_SERVICE_GRPC_PORT = int(os.getenv('GO_SERVICE_GRPC_PORT', 50051))
+GRPC_POOL_SIZE = int(os.getenv('GRPC_POOL_SIZE', 4))
 
 JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'default-jwt-secret-key')
 JWT_ALGORITHM = os.getenv('JWT_ALGORITHM', 'HS256')
@@ -1,13 +1,31 @@
+import atexit
+import logging
+
 from django.apps import AppConfig
 
+logger = logging.getLogger(__name__)
+
+NATIVE_PROTOBUF_IMPLEMENTATIONS = ('upb', 'cpp')
+
 
 class EngineConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'engine'
 
     def ready(self):
+        from google.protobuf.internal import api_implementation
         from engine.models import SearchHistory
+        from engine.grpc_client import close_channel_pool
         try:
             SearchHistory.ensure_indexes()
         except Exception as e:
             pass
+
+        atexit.register(close_channel_pool)
+
+        protobuf_implementation = api_implementation.Type()
+        if protobuf_implementation not in NATIVE_PROTOBUF_IMPLEMENTATIONS:
+            logger.warning(
+                f"Protobuf is running the '{protobuf_implementation}' implementation; "
+                f"search response mapping will be slow. Expected one of: {', '.join(NATIVE_PROTOBUF_IMPLEMENTATIONS)}"
+            )
@@ -1,3 +1,3 @@
-from .search_grpc_client import SearchGrpcClient
+from .search_grpc_client import SearchGrpcClient, close_channel_pool
 
-__all__ = ['SearchGrpcClient']
+__all__ = ['SearchGrpcClient', 'close_channel_pool']
@@ -1,7 +1,26 @@
+import itertools
+import threading
+from concurrent.futures import Future
+
 import grpc
 from django.conf import settings
 from proto import search_pb2, search_pb2_grpc
 
+CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.max_concurrent_streams', 1000),
+]
+
+_POOL_LOCK = threading.Lock()
+_CHANNEL_POOLS = {}
+_STUB_POOLS = {}
+_COUNTER = itertools.count()
+
+_REQUEST_LOCAL = threading.local()
+
+_IN_FLIGHT_LOCK = threading.Lock()
+_IN_FLIGHT_SEARCHES = {}
+
 
 class SearchGrpcClient:
 
@@ -10,33 +29,93 @@ class SearchGrpcClient:
         self.port = port or settings.GO_SERVICE_GRPC_PORT
         self.address = f"{self.host}:{self.port}"
 
-    def _create_channel(self):
-        return grpc.insecure_channel(self.address)
+    def _next_stub(self):
+        stubs = _get_stubs(self.address)
+        return stubs[next(_COUNTER) % len(stubs)]
 
     def federated_search(self, query, max_results, platforms):
-        with self._create_channel() as channel:
-            stub = search_pb2_grpc.SearchServiceStub(channel)
+        key = (self.address, query, max_results, tuple(platforms))
+
+        with _IN_FLIGHT_LOCK:
+            future = _IN_FLIGHT_SEARCHES.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                _IN_FLIGHT_SEARCHES[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            response = self._call_federated_search(query, max_results, platforms)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _IN_FLIGHT_LOCK:
+                _IN_FLIGHT_SEARCHES.pop(key, None)
+
+    def _call_federated_search(self, query, max_results, platforms):
+        stub = self._next_stub()
 
-            request = search_pb2.SearchRequest(
-                query=query,
-                max_results=max_results,
-                platforms=platforms
-            )
+        request = _get_search_request()
+        request.query = query
+        request.max_results = max_results
+        request.platforms.extend(platforms)
 
-            try:
-                response = stub.FederatedSearch(request, timeout=5.0)
-                return response
-            except grpc.RpcError as e:
-                raise Exception(f"gRPC call failed: {e.details()}")
+        try:
+            response = stub.FederatedSearch(request, timeout=5.0)
+            return response
+        except grpc.RpcError as e:
+            raise Exception(f"gRPC call failed: {e.details()}")
 
     def health_check(self):
-        with self._create_channel() as channel:
-            stub = search_pb2_grpc.SearchServiceStub(channel)
+        stub = self._next_stub()
+
+        request = search_pb2.HealthCheckRequest()
+
+        try:
+            response = stub.HealthCheck(request, timeout=2.0)
+            return response
+        except grpc.RpcError as e:
+            raise Exception(f"Health check failed: {e.details()}")
+
+
+def _get_stubs(address):
+    stubs = _STUB_POOLS.get(address)
+    if stubs is not None:
+        return stubs
+
+    with _POOL_LOCK:
+        stubs = _STUB_POOLS.get(address)
+        if stubs is None:
+            channels = [
+                grpc.insecure_channel(address, options=CHANNEL_OPTIONS)
+                for _ in range(settings.GRPC_POOL_SIZE)
+            ]
+            stubs = [search_pb2_grpc.SearchServiceStub(channel) for channel in channels]
+            _CHANNEL_POOLS[address] = channels
+            _STUB_POOLS[address] = stubs
+
+    return stubs
+
+
+def _get_search_request():
+    request = getattr(_REQUEST_LOCAL, 'search_request', None)
+    if request is None:
+        request = search_pb2.SearchRequest()
+        _REQUEST_LOCAL.search_request = request
+    else:
+        request.Clear()
+    return request
 
-            request = search_pb2.HealthCheckRequest()
 
-            try:
-                response = stub.HealthCheck(request, timeout=2.0)
-                return response
-            except grpc.RpcError as e:
-                raise Exception(f"Health check failed: {e.details()}")
+def close_channel_pool():
+    with _POOL_LOCK:
+        for channels in _CHANNEL_POOLS.values():
+            for channel in channels:
+                channel.close()
+        _CHANNEL_POOLS.clear()
+        _STUB_POOLS.clear()
@@ -8,9 +8,9 @@ class SearchResponseMapper:
                 for result in grpc_response.results
             ],
             'total_count': grpc_response.total_count,
-            'platforms_success': list(grpc_response.platforms_success),
-            'platforms_timeout': list(grpc_response.platforms_timeout),
-            'platforms_error': list(grpc_response.platforms_error),
+            'platforms_success': tuple(grpc_response.platforms_success),
+            'platforms_timeout': tuple(grpc_response.platforms_timeout),
+            'platforms_error': tuple(grpc_response.platforms_error),
             'metadata': SearchResponseMapper._map_metadata(grpc_response.metadata)
         }
 
@@ -13,7 +13,6 @@ class SearchHistory(Document):
     meta = {
         'collection': 'search_histories',
         'indexes': [
-            'user',
             '-created_at',
             ('user', '-created_at')
         ]
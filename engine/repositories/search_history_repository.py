@@ -1,26 +1,56 @@
+from datetime import datetime
+from pymongo import DESCENDING
+from pymongo.write_concern import WriteConcern
 from engine.models import SearchHistory
 
+HISTORY_PROJECTION = {
+    'user': 1,
+    'platforms': 1,
+    'query': 1,
+    'max_results': 1,
+    'created_at': 1
+}
+
 
 class SearchHistoryRepository:
 
     def __init__(self):
-        pass
+        self._unacknowledged = None
+
+    def _collection(self):
+        return SearchHistory._get_collection()
+
+    def _unacknowledged_collection(self):
+        if self._unacknowledged is None:
+            self._unacknowledged = self._collection().with_options(write_concern=WriteConcern(w=0))
+        return self._unacknowledged
 
     def create(self, user, platforms, query, max_results):
-        search_history = SearchHistory(
-            user=user,
-            platforms=platforms,
-            query=query,
-            max_results=max_results
-        )
-        search_history.save()
+        search_history = {
+            'user': user.id,
+            'platforms': platforms,
+            'query': query,
+            'max_results': max_results,
+            'created_at': datetime.utcnow()
+        }
+        self._unacknowledged_collection().insert_one(search_history)
         return search_history
 
     def find_by_user(self, user, limit=50):
-        return SearchHistory.objects(user=user).order_by('-created_at').limit(limit)
+        return list(
+            self._collection()
+            .find({'user': user.id}, HISTORY_PROJECTION)
+            .sort('created_at', DESCENDING)
+            .limit(limit)
+        )
 
     def find_recent(self, limit=100):
-        return SearchHistory.objects.order_by('-created_at').limit(limit)
+        return list(
+            self._collection()
+            .find({}, HISTORY_PROJECTION)
+            .sort('created_at', DESCENDING)
+            .limit(limit)
+        )
 
     def count_by_user(self, user):
-        return SearchHistory.objects(user=user).count()
+        return self._collection().count_documents({'user': user.id})
@@ -5,6 +5,7 @@ class ServiceResult:
         self.data = data
         self.message = message
         self.errors = errors
+        self._dict = self._build_dict()
 
     @classmethod
     def ok(cls, data=None, message=None):
@@ -14,7 +15,7 @@ class ServiceResult:
     def fail(cls, message, errors=None):
         return cls(success=False, message=message, errors=errors)
 
-    def to_dict(self):
+    def _build_dict(self):
         result = {'success': self.success}
 
         if self.message:
@@ -27,3 +28,6 @@ class ServiceResult:
             result['errors'] = self.errors
 
         return result
+
+    def to_dict(self):
+        return self._dict
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+ALLOWED_PLATFORMS = frozenset(('github', 'stackoverflow', 'reddit'))
+
 
 class SearchRequestSerializer(serializers.Serializer):
     platforms = serializers.ListField(
@@ -11,13 +13,14 @@ class SearchRequestSerializer(serializers.Serializer):
     max_results = serializers.IntegerField(required=False, default=20, min_value=1, max_value=100)
 
     def validate_platforms(self, value):
-        allowed_platforms = ['github', 'stackoverflow', 'reddit']
-        for platform in value:
-            if platform.lower() not in allowed_platforms:
-                raise serializers.ValidationError(
-                    f"Invalid platform: {platform}. Allowed platforms: {', '.join(allowed_platforms)}"
-                )
-        return [p.lower() for p in value]
+        lowered = [platform.lower() for platform in value]
+        invalid_platforms = set(lowered) - ALLOWED_PLATFORMS
+        if invalid_platforms:
+            raise serializers.ValidationError(
+                f"Invalid platform(s): {', '.join(sorted(invalid_platforms))}. "
+                f"Allowed platforms: {', '.join(sorted(ALLOWED_PLATFORMS))}"
+            )
+        return lowered
 
     def validate_query(self, value):
         if not value.strip():
@@ -1,8 +1,21 @@
+import logging
+import queue
+import threading
+
 from engine.grpc_client import SearchGrpcClient
 from engine.mappers import SearchResponseMapper
 from engine.repositories import SearchHistoryRepository
 from engine.exceptions import SearchServiceException
 
+logger = logging.getLogger(__name__)
+
+HISTORY_WRITER_WORKERS = 4
+HISTORY_QUEUE_MAX_SIZE = 10000
+
+_HISTORY_QUEUE = queue.Queue(maxsize=HISTORY_QUEUE_MAX_SIZE)
+_HISTORY_WRITERS = []
+_HISTORY_WRITERS_LOCK = threading.Lock()
+
 
 class SearchService:
 
@@ -24,36 +37,66 @@ class SearchService:
         except Exception as e:
             raise SearchServiceException(f"Search failed: {str(e)}")
 
-    def save_search_history(self, user, platforms, query, max_results):
-        search_history = self.search_history_repository.create(
-            user=user,
-            platforms=platforms,
-            query=query,
-            max_results=max_results
-        )
+    def save_search_history_in_background(self, user, platforms, query, max_results):
+        _ensure_history_writers()
 
-        return {
-            'history_id': str(search_history.id),
-            'user_id': str(search_history.user.id),
-            'platforms': search_history.platforms,
-            'query': search_history.query,
-            'max_results': search_history.max_results,
-            'created_at': search_history.created_at.isoformat()
+        history = {
+            'user': user,
+            'platforms': platforms,
+            'query': query,
+            'max_results': max_results
         }
 
+        try:
+            _HISTORY_QUEUE.put_nowait((self.search_history_repository, history))
+        except queue.Full:
+            logger.warning("Search history queue is full, dropping entry")
+            return False
+
+        return True
+
     def get_user_search_history(self, user, limit=50):
         histories = self.search_history_repository.find_by_user(user, limit)
 
         return {
             'histories': [
                 {
-                    'history_id': str(h.id),
-                    'platforms': h.platforms,
-                    'query': h.query,
-                    'max_results': h.max_results,
-                    'created_at': h.created_at.isoformat()
+                    'history_id': str(h['_id']),
+                    'platforms': h['platforms'],
+                    'query': h['query'],
+                    'max_results': h['max_results'],
+                    'created_at': h['created_at'].isoformat()
                 }
                 for h in histories
             ],
             'total': len(histories)
         }
+
+
+def _ensure_history_writers():
+    if _HISTORY_WRITERS:
+        return
+
+    with _HISTORY_WRITERS_LOCK:
+        if _HISTORY_WRITERS:
+            return
+
+        for index in range(HISTORY_WRITER_WORKERS):
+            writer = threading.Thread(
+                target=_drain_history_queue,
+                name=f'search-history-{index}',
+                daemon=True
+            )
+            writer.start()
+            _HISTORY_WRITERS.append(writer)
+
+
+def _drain_history_queue():
+    while True:
+        search_history_repository, history = _HISTORY_QUEUE.get()
+        try:
+            search_history_repository.create(**history)
+        except Exception as e:
+            logger.error(f"Failed to save search history: {e}")
+        finally:
+            _HISTORY_QUEUE.task_done()
@@ -1,3 +1,58 @@
-from django.test import TestCase
+from unittest.mock import Mock, patch
 
-# Create your tests here.
+from bson import ObjectId
+from django.test import SimpleTestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from engine.views import SearchView, SearchHistoryView
+from user.authentication import JWTAuthentication
+from user.models import AuthUser
+from user.services import JwtService
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AuthenticatedSearchViewTests(SimpleTestCase):
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.user = AuthUser(id=ObjectId(), email='user@example.com', is_active=True)
+        token = JwtService().generate_access_token(str(self.user.id), self.user.email, name='User')
+        self.auth_header = f'Bearer {token}'
+
+        self.search_service = Mock()
+        self.search_service.search.return_value = {'results': []}
+        self.search_service.get_user_search_history.return_value = {'histories': [], 'total': 0}
+
+        patchers = [
+            patch.object(JWTAuthentication.user_repository, 'find_auth_fields', return_value=self.user),
+            patch.object(SearchView, 'search_service', self.search_service),
+            patch.object(SearchHistoryView, 'search_service', self.search_service),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_search_with_bearer_token(self):
+        request = self.factory.post(
+            '/api/v1/engine/search/',
+            {'platforms': ['github'], 'query': 'django'},
+            format='json',
+            HTTP_AUTHORIZATION=self.auth_header
+        )
+
+        response = SearchView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['success'])
+        self.search_service.save_search_history_in_background.assert_called_once()
+
+    def test_search_history_with_bearer_token(self):
+        request = self.factory.get('/api/v1/engine/search/histories/', HTTP_AUTHORIZATION=self.auth_header)
+
+        response = SearchHistoryView.as_view()(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data'], {'histories': [], 'total': 0})
@@ -8,13 +8,12 @@ from engine.result import ServiceResult
 from engine.exceptions import SearchServiceException
 from user.authentication import JWTAuthentication
 
+_SEARCH_SERVICE = SearchService()
+
 
 class SearchView(APIView):
     authentication_classes = [JWTAuthentication]
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.search_service = SearchService()
+    search_service = _SEARCH_SERVICE
 
     def post(self, request):
         serializer = SearchRequestSerializer(data=request.data)
@@ -32,7 +31,7 @@ class SearchView(APIView):
             )
 
             if request.user and request.user.is_authenticated:
-                self.search_service.save_search_history(
+                self.search_service.save_search_history_in_background(
                     user=request.user,
                     platforms=platforms,
                     query=query,
@@ -50,10 +49,7 @@ class SearchView(APIView):
 class SearchHistoryView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated]
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.search_service = SearchService()
+    search_service = _SEARCH_SERVICE
 
     def get(self, request):
         serializer = SearchHistoryQuerySerializer(data=request.query_params)
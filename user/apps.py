@@ -1,5 +1,9 @@
+import logging
+
 from django.apps import AppConfig
 
+logger = logging.getLogger(__name__)
+
 
 class UserConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
@@ -11,4 +15,4 @@ class UserConfig(AppConfig):
             User.ensure_indexes()
             UserActivation.ensure_indexes()
         except Exception as e:
-            pass
+            logger.error(f"Failed to ensure user indexes: {e}")
@@ -5,10 +5,8 @@ from user.repositories import UserRepository
 
 
 class JWTAuthentication(BaseAuthentication):
-
-    def __init__(self):
-        self.jwt_service = JwtService()
-        self.user_repository = UserRepository()
+    jwt_service = JwtService()
+    user_repository = UserRepository()
 
     def authenticate(self, request):
         auth_header = request.headers.get('Authorization')
@@ -32,7 +30,7 @@ class JWTAuthentication(BaseAuthentication):
             if not user_id:
                 raise AuthenticationFailed('Invalid token payload')
 
-            user = self.user_repository.find_by_id(user_id)
+            user = self.user_repository.find_auth_fields(user_id)
 
             if not user:
                 raise AuthenticationFailed('User not found')
@@ -40,7 +38,7 @@ class JWTAuthentication(BaseAuthentication):
             if not user.is_active:
                 raise AuthenticationFailed('User account is not active')
 
-            return (user, token)
+            return (user._replace(name=payload.get('name')), token)
 
         except Exception as e:
             raise AuthenticationFailed(str(e))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from user.services import ActivationService
+
+
+class Command(BaseCommand):
+    help = 'Replace plaintext activation codes with their sha256 hashes'
+
+    def handle(self, *args, **options):
+        count = ActivationService().hash_legacy_codes()
+        self.stdout.write(self.style.SUCCESS(f"Hashed {count} legacy activation code(s)"))
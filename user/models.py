@@ -1,3 +1,4 @@
+from collections import namedtuple
 from mongoengine import Document, StringField, BooleanField, EmailField, DateTimeField, ReferenceField
 from datetime import datetime
 
@@ -13,7 +14,6 @@ class User(Document):
     meta = {
         'collection': 'users',
         'indexes': [
-            'email',
             'is_active',
             '-created_at'
         ]
@@ -28,20 +28,35 @@ class User(Document):
         return False
 
 
+class AuthUser(namedtuple('AuthUser', ['id', 'email', 'is_active', 'name'], defaults=(None,))):
+    __slots__ = ()
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def is_authenticated(self):
+        return True
+
+    @property
+    def is_anonymous(self):
+        return False
+
+
 class UserActivation(Document):
     user = ReferenceField(User, required=True)
-    code = StringField(required=True, max_length=6)
+    code_hash = StringField(required=True, max_length=64)
     expiry = DateTimeField(required=True)
     is_used = BooleanField(default=False)
     created_at = DateTimeField(default=datetime.utcnow)
 
     meta = {
         'collection': 'user_activations',
+        'strict': False,
         'indexes': [
-            'user',
-            'code',
-            'expiry',
-            'is_used',
+            ('user', 'is_used', '-created_at', 'expiry'),
+            {'fields': ['expiry'], 'expireAfterSeconds': 0},
             '-created_at'
         ]
     }
@@ -1,33 +1,44 @@
+from pymongo import UpdateOne
+
 from user.models import UserActivation
 from datetime import datetime
 
+LEGACY_CODE_FILTER = {'code': {'$exists': True}}
+LEGACY_CODE_PROJECTION = {'_id': 1, 'code': 1}
+
 
 class ActivationRepository:
 
     def __init__(self):
         pass
 
-    def create(self, user, code, expiry):
+    def create(self, user, code_hash, expiry):
         activation = UserActivation(
             user=user,
-            code=code,
+            code_hash=code_hash,
             expiry=expiry,
             is_used=False
         )
         activation.save()
         return activation
 
-    def find_by_user_and_code(self, user, code):
+    def find_active_by_user(self, user):
         return UserActivation.objects(
             user=user,
-            code=code,
-            is_used=False
-        ).first()
+            is_used=False,
+            expiry__gt=datetime.utcnow()
+        ).order_by('-created_at').first()
 
     def mark_as_used(self, activation):
         activation.is_used = True
         activation.save()
         return activation
 
-    def is_expired(self, activation):
-        return activation.expiry < datetime.utcnow()
+    def find_legacy_codes(self):
+        return UserActivation._get_collection().find(LEGACY_CODE_FILTER, LEGACY_CODE_PROJECTION)
+
+    def replace_codes_with_hashes(self, code_hashes):
+        UserActivation._get_collection().bulk_write([
+            UpdateOne({'_id': activation_id}, {'$set': {'code_hash': code_hash}, '$unset': {'code': ''}})
+            for activation_id, code_hash in code_hashes.items()
+        ], ordered=False)
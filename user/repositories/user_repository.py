@@ -1,41 +1,113 @@
-from user.models import User
-from user.exceptions import UserNotFoundException
+import threading
+from concurrent.futures import Future
 from datetime import datetime
 
+from bson import ObjectId
+from cachetools import TTLCache
+from mongoengine import NotUniqueError
+
+from user.models import User, AuthUser
+from user.exceptions import UserNotFoundException, UserAlreadyExistsException
+
+USER_CACHE_MAX_SIZE = 10000
+USER_CACHE_TTL_SECONDS = 60
+
+_USER_CACHE = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+_USER_CACHE_LOCK = threading.Lock()
+_IN_FLIGHT_AUTH_LOOKUPS = {}
+
+AUTH_FIELDS_PROJECTION = {'_id': 1, 'email': 1, 'is_active': 1}
+
+PROFILE_FIELDS = ('id', 'email', 'name', 'is_active', 'created_at')
+CREDENTIAL_PROJECTION = {'_id': 1, 'email': 1, 'name': 1, 'password': 1, 'is_active': 1}
+
 
 class UserRepository:
 
     def __init__(self):
         pass
 
-    def find_by_email(self, email):
-        return User.objects(email=email.lower()).first()
+    def find_by_email_for_auth(self, email):
+        return User._get_collection().find_one({'email': email}, CREDENTIAL_PROJECTION)
 
     def find_by_id(self, user_id):
         return User.objects(id=user_id).first()
 
-    def exists_by_email(self, email):
-        return User.objects(email=email.lower()).count() > 0
+    def find_auth_fields(self, user_id):
+        cache_key = str(user_id)
+
+        with _USER_CACHE_LOCK:
+            user = _USER_CACHE.get(cache_key)
+            if user is not None:
+                return user
+
+            future = _IN_FLIGHT_AUTH_LOOKUPS.get(cache_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                _IN_FLIGHT_AUTH_LOOKUPS[cache_key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            user = self._load_auth_fields(user_id)
+            future.set_result(user)
+            return user
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _USER_CACHE_LOCK:
+                _IN_FLIGHT_AUTH_LOOKUPS.pop(cache_key, None)
+
+    def _load_auth_fields(self, user_id):
+        document = User._get_collection().find_one({'_id': ObjectId(user_id)}, AUTH_FIELDS_PROJECTION)
+        if document is None:
+            return None
+
+        user = AuthUser(
+            id=document['_id'],
+            email=document.get('email'),
+            is_active=document.get('is_active', False)
+        )
+        with _USER_CACHE_LOCK:
+            _USER_CACHE[str(user_id)] = user
+
+        return user
+
+    def evict(self, user):
+        with _USER_CACHE_LOCK:
+            _USER_CACHE.pop(str(user.id), None)
 
     def create(self, email, name, hashed_password):
         user = User(
-            email=email.lower(),
+            email=email,
             name=name,
             password=hashed_password,
             is_active=False
         )
-        user.save()
+        try:
+            user.save(force_insert=True)
+        except NotUniqueError:
+            raise UserAlreadyExistsException("User with this email already exists")
         return user
 
     def activate(self, user):
+        updated_at = datetime.utcnow()
+        User.objects(id=user.id).update_one(set__is_active=True, set__updated_at=updated_at)
         user.is_active = True
-        user.updated_at = datetime.utcnow()
-        user.save()
+        user.updated_at = updated_at
+        self.evict(user)
         return user
 
+    def update_password(self, user_id, hashed_password):
+        User.objects(id=user_id).update_one(set__password=hashed_password)
+
     def update(self, user):
         user.updated_at = datetime.utcnow()
         user.save()
+        self.evict(user)
         return user
 
     def get_by_id_or_fail(self, user_id):
@@ -45,7 +117,7 @@ class UserRepository:
         return user
 
     def get_by_email_or_fail(self, email):
-        user = self.find_by_email(email)
+        user = User.objects(email=email).only(*PROFILE_FIELDS).first()
         if not user:
             raise UserNotFoundException(f"User with email {email} not found")
         return user
@@ -7,6 +7,9 @@ class SignupSerializer(serializers.Serializer):
     password = serializers.CharField(required=True, min_length=8, write_only=True)
     confirm_password = serializers.CharField(required=True, min_length=8, write_only=True)
 
+    def validate_email(self, value):
+        return value.lower()
+
     def validate(self, data):
         if data['password'] != data['confirm_password']:
             raise serializers.ValidationError({"confirm_password": "Passwords do not match"})
@@ -18,6 +21,9 @@ class SigninSerializer(serializers.Serializer):
     email = serializers.EmailField(required=True)
     password = serializers.CharField(required=True, write_only=True)
 
+    def validate_email(self, value):
+        return value.lower()
+
 
 class ActivateUserSerializer(serializers.Serializer):
     user_id = serializers.CharField(required=True)
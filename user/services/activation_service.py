@@ -1,7 +1,9 @@
-import random
+import hashlib
+import hmac
+import secrets
 from datetime import datetime, timedelta
 from user.repositories import ActivationRepository
-from user.exceptions import InvalidActivationCodeException, ActivationCodeExpiredException
+from user.exceptions import InvalidActivationCodeException
 
 
 class ActivationService:
@@ -10,13 +12,16 @@ class ActivationService:
         self.activation_repository = activation_repository or ActivationRepository()
 
     def generate_code(self):
-        return ''.join([str(random.randint(0, 9)) for _ in range(6)])
+        return f"{secrets.randbelow(1_000_000):06d}"
+
+    def _hash_code(self, code):
+        return hashlib.sha256(code.encode()).hexdigest()
 
     def create_activation(self, user, expiry_hours=24):
         code = self.generate_code()
         expiry = datetime.utcnow() + timedelta(hours=expiry_hours)
 
-        activation = self.activation_repository.create(user, code, expiry)
+        activation = self.activation_repository.create(user, self._hash_code(code), expiry)
 
         return {
             'code': code,
@@ -24,12 +29,18 @@ class ActivationService:
         }
 
     def verify_code(self, user, code):
-        activation = self.activation_repository.find_by_user_and_code(user, code)
+        activation = self.activation_repository.find_active_by_user(user)
 
-        if not activation:
+        if not activation or not hmac.compare_digest(activation.code_hash or '', self._hash_code(code)):
             raise InvalidActivationCodeException("Invalid activation code")
 
-        if self.activation_repository.is_expired(activation):
-            raise ActivationCodeExpiredException("Activation code has expired")
-
         self.activation_repository.mark_as_used(activation)
+
+    def hash_legacy_codes(self):
+        code_hashes = {
+            activation['_id']: self._hash_code(activation['code'])
+            for activation in self.activation_repository.find_legacy_codes()
+        }
+        if code_hashes:
+            self.activation_repository.replace_codes_with_hashes(code_hashes)
+        return len(code_hashes)
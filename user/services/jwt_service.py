@@ -1,7 +1,19 @@
-import jwt
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
+
+import jwt
+from cachetools import TTLCache
+
 from django.conf import settings
 
+VERIFIED_TOKEN_CACHE_MAX_SIZE = 50_000
+VERIFIED_TOKEN_CACHE_TTL_SECONDS = 300
+
+_VERIFIED_TOKENS = TTLCache(maxsize=VERIFIED_TOKEN_CACHE_MAX_SIZE, ttl=VERIFIED_TOKEN_CACHE_TTL_SECONDS)
+_VERIFIED_TOKENS_LOCK = threading.Lock()
+
 
 class JwtService:
 
@@ -9,13 +21,18 @@ class JwtService:
         self.secret_key = settings.JWT_SECRET_KEY
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expire_minutes = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
+        self._algorithms = [self.algorithm]
+        self._access_delta = timedelta(minutes=self.access_token_expire_minutes)
+        self._refresh_delta = timedelta(days=7)
 
-    def generate_access_token(self, user_id, email):
+    def generate_access_token(self, user_id, email, name=None):
+        now = datetime.utcnow()
         payload = {
             'user_id': user_id,
             'email': email,
-            'exp': datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes),
-            'iat': datetime.utcnow(),
+            'name': name,
+            'exp': now + self._access_delta,
+            'iat': now,
             'type': 'access'
         }
 
@@ -23,11 +40,12 @@ class JwtService:
         return token
 
     def generate_refresh_token(self, user_id, email):
+        now = datetime.utcnow()
         payload = {
             'user_id': user_id,
             'email': email,
-            'exp': datetime.utcnow() + timedelta(days=7),
-            'iat': datetime.utcnow(),
+            'exp': now + self._refresh_delta,
+            'iat': now,
             'type': 'refresh'
         }
 
@@ -36,7 +54,7 @@ class JwtService:
 
     def decode_token(self, token):
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = jwt.decode(token, self.secret_key, algorithms=self._algorithms)
             return payload
         except jwt.ExpiredSignatureError:
             raise Exception("Token has expired")
@@ -44,12 +62,25 @@ class JwtService:
             raise Exception("Invalid token")
 
     def verify_token(self, token):
-        try:
-            payload = self.decode_token(token)
-            return {
-                'user_id': payload.get('user_id'),
-                'email': payload.get('email'),
-                'type': payload.get('type')
-            }
-        except Exception as e:
-            raise e
+        cache_key = hashlib.sha256(token.encode()).digest()
+
+        with _VERIFIED_TOKENS_LOCK:
+            claims = _VERIFIED_TOKENS.get(cache_key)
+
+        if claims is not None and claims['exp'] > time.time():
+            return claims
+
+        payload = self.decode_token(token)
+        claims = {
+            'user_id': payload.get('user_id'),
+            'email': payload.get('email'),
+            'name': payload.get('name'),
+            'type': payload.get('type'),
+            'exp': payload.get('exp')
+        }
+
+        if claims['exp']:
+            with _VERIFIED_TOKENS_LOCK:
+                _VERIFIED_TOKENS[cache_key] = claims
+
+        return claims
@@ -1,13 +1,19 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from django.contrib.auth.hashers import make_password, check_password
+from django.utils.crypto import get_random_string
 from user.repositories import UserRepository
 from user.services.activation_service import ActivationService
 from user.services.jwt_service import JwtService
 from user.exceptions import (
-    UserAlreadyExistsException,
     InvalidCredentialsException,
     AccountNotActiveException
 )
 
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='password-hash')
+
 
 class UserService:
 
@@ -17,10 +23,7 @@ class UserService:
         self.jwt_service = jwt_service or JwtService()
 
     def create_user(self, email, name, password):
-        if self.user_repository.exists_by_email(email):
-            raise UserAlreadyExistsException("User with this email already exists")
-
-        hashed_password = make_password(password)
+        hashed_password = self._hash_password(password)
         user = self.user_repository.create(email, name, hashed_password)
 
         activation_data = self.activation_service.create_activation(user)
@@ -35,45 +38,55 @@ class UserService:
         }
 
     def authenticate_user(self, email, password):
-        user = self.user_repository.find_by_email(email)
-
-        if not user:
-            raise InvalidCredentialsException("Invalid email or password")
+        user = self.user_repository.find_by_email_for_auth(email)
 
-        if not check_password(password, user.password):
+        if not self._verify_password(user, password):
             raise InvalidCredentialsException("Invalid email or password")
 
-        if not user.is_active:
+        if not user.get('is_active', False):
             raise AccountNotActiveException("Account is not active")
 
         return {
-            'user_id': str(user.id),
-            'email': user.email,
-            'name': user.name,
-            'is_active': user.is_active
+            'user_id': str(user['_id']),
+            'email': user['email'],
+            'name': user['name'],
+            'is_active': user.get('is_active', False)
         }
 
     def signin_user(self, email, password):
-        user = self.user_repository.find_by_email(email)
+        user = self.user_repository.find_by_email_for_auth(email)
 
-        if not user:
+        if not self._verify_password(user, password):
             raise InvalidCredentialsException("Invalid email or password")
 
-        if not check_password(password, user.password):
-            raise InvalidCredentialsException("Invalid email or password")
-
-        if not user.is_active:
+        if not user.get('is_active', False):
             raise AccountNotActiveException("Account is not active")
 
         access_token = self.jwt_service.generate_access_token(
-            user_id=str(user.id),
-            email=user.email
+            user_id=str(user['_id']),
+            email=user['email'],
+            name=user['name']
         )
 
         return {
             'access_token': access_token
         }
 
+    def _hash_password(self, password):
+        return _HASH_POOL.submit(make_password, password).result()
+
+    def _verify_password(self, user, password):
+        if user is None:
+            _HASH_POOL.submit(check_password, password, _get_dummy_password_hash()).result()
+            return False
+
+        return _HASH_POOL.submit(
+            check_password,
+            password,
+            user['password'],
+            setter=lambda raw_password: self.user_repository.update_password(user['_id'], make_password(raw_password))
+        ).result()
+
     def activate_user(self, user_id, code):
         user = self.user_repository.get_by_id_or_fail(user_id)
 
@@ -108,3 +121,9 @@ class UserService:
             'is_active': user.is_active,
             'created_at': user.created_at.isoformat()
         }
+
+
+@lru_cache(maxsize=None)
+def _get_dummy_password_hash():
+    return make_password(get_random_string(32))
+
@@ -9,16 +9,14 @@ from user.exceptions import (
     InvalidCredentialsException,
     AccountNotActiveException,
     UserNotFoundException,
-    InvalidActivationCodeException,
-    ActivationCodeExpiredException
+    InvalidActivationCodeException
 )
 
+_USER_SERVICE = UserService()
 
-class SignupView(APIView):
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.user_service = UserService()
+class SignupView(APIView):
+    user_service = _USER_SERVICE
 
     def post(self, request):
         serializer = SignupSerializer(data=request.data)
@@ -39,10 +37,7 @@ class SignupView(APIView):
 
 
 class SigninView(APIView):
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.user_service = UserService()
+    user_service = _USER_SERVICE
 
     def post(self, request):
         serializer = SigninSerializer(data=request.data)
@@ -66,10 +61,7 @@ class SigninView(APIView):
 
 
 class ActivateUserView(APIView):
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.user_service = UserService()
+    user_service = _USER_SERVICE
 
     def post(self, request):
         serializer = ActivateUserSerializer(data=request.data)
@@ -87,6 +79,6 @@ class ActivateUserView(APIView):
             result = ServiceResult.fail(message=str(e))
             return Response(result.to_dict(), status=status.HTTP_404_NOT_FOUND)
 
-        except (InvalidActivationCodeException, ActivationCodeExpiredException) as e:
+        except InvalidActivationCodeException as e:
             result = ServiceResult.fail(message=str(e))
             return Response(result.to_dict(), status=status.HTTP_400_BAD_REQUEST)